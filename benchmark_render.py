@@ -0,0 +1,225 @@
+"""Compare the Surface and SDL2 Renderer backends on identical scenes.
+
+Usage: python benchmark_render.py [--frames N]
+Headless / no GPU: SDL_VIDEODRIVER=dummy SDL_RENDER_DRIVER=software python benchmark_render.py
+"""
+import os
+import sys
+import time
+import random
+import pygame
+import render
+from render import render_text
+
+WIDTH, HEIGHT = 1280, 800
+ENEMY_SIZE = (64, 48)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GRAY = (180, 180, 180)
+FRAMES = 300
+# Max per-channel difference still counted as "same": SDL's blender rounds
+# anti-aliased text edges over non-black backgrounds up to 3 levels differently
+PIXEL_TOLERANCE = 4
+
+LEADERBOARD = [
+    {"name": f"Player {i}", "company": f"Company {i}", "score": 1000 - i * 37, "level": 1 + i // 3}
+    for i in range(12)
+]
+
+
+def load_assets(screen):
+    assets = {"logo": None, "player": None, "enemies": []}
+    if os.path.exists("logo.png"):
+        logo = screen.convert(pygame.image.load("logo.png"))
+        w = min(max(150, WIDTH // 6), logo.get_width())
+        h = int(w / max(1, logo.get_width() / max(1, logo.get_height())))
+        assets["logo"] = pygame.transform.smoothscale(logo, (w, h))
+    if os.path.exists("player.png"):
+        assets["player"] = pygame.transform.smoothscale(screen.convert(pygame.image.load("player.png")), (80, 60))
+    if os.path.exists("enemies"):
+        for file in sorted(os.listdir("enemies")):
+            if file.lower().endswith(".png"):
+                img = screen.convert(pygame.image.load(os.path.join("enemies", file)))
+                assets["enemies"].append(pygame.transform.smoothscale(img, ENEMY_SIZE))
+    if not assets["enemies"]:
+        fallback = pygame.Surface(ENEMY_SIZE, pygame.SRCALPHA)
+        fallback.fill(RED)
+        assets["enemies"] = [fallback]
+    if assets["player"] is None:
+        assets["player"] = pygame.Surface((70, 40))
+        assets["player"].fill((0, 255, 0))
+    return assets
+
+
+def draw_leaderboard(screen, fonts, entries, top_n, x, y):
+    font, small_font, mono_font = fonts
+    header = render_text(font, "Top Scores", WHITE)
+    screen.blit(header, (x - header.get_width() // 2, y))
+    y += header.get_height() + 6
+    hdr = render_text(mono_font, "   NAME              COMPANY            SCORE  LVL", GRAY)
+    screen.blit(hdr, (x - 320, y))
+    y += hdr.get_height() + 2
+    for idx, e in enumerate(entries[:top_n], start=1):
+        line = f"{idx:>2}. {e['name']:<16}  {e['company']:<18}  {e['score']:>5}  L{e['level']:<2}"
+        txt = render_text(mono_font, line, WHITE)
+        screen.blit(txt, (x - 320, y))
+        y += txt.get_height() + 2
+
+
+def make_gameplay_scene(screen, assets, fonts):
+    """Full wave of invaders, player, bullets, logo and HUD."""
+    rng = random.Random(1)
+    invaders = pygame.sprite.Group()
+    for r in range(8):
+        for c in range(10):
+            spr = pygame.sprite.Sprite()
+            spr.image = rng.choice(assets["enemies"])
+            spr.rect = spr.image.get_rect(topleft=(200 + c * (ENEMY_SIZE[0] + 24), 80 + r * (ENEMY_SIZE[1] + 28)))
+            invaders.add(spr)
+    bullet_images = {}
+    for color, size in ((WHITE, (6, 20)), (RED, (6, 18))):
+        bullet_images[color] = pygame.Surface(size)
+        bullet_images[color].fill(color)
+    bullets = pygame.sprite.Group()
+    for i in range(24):
+        spr = pygame.sprite.Sprite()
+        spr.image = bullet_images[WHITE if i % 2 else RED]
+        spr.rect = spr.image.get_rect(center=(rng.randrange(WIDTH), rng.randrange(HEIGHT)))
+        bullets.add(spr)
+    player = pygame.sprite.GroupSingle(pygame.sprite.Sprite())
+    player.sprite.image = assets["player"]
+    player.sprite.rect = assets["player"].get_rect(midbottom=(WIDTH // 2, HEIGHT - 30))
+    logo = assets["logo"]
+    small_font = fonts[1]
+
+    def draw(frame):
+        dx = (frame % 40) - 20
+        for spr in invaders:
+            spr.rect.x += 1 if dx >= 0 else -1
+        for spr in bullets:
+            spr.rect.y = (spr.rect.y + 7) % HEIGHT
+        screen.fill(BLACK)
+        player.draw(screen)
+        bullets.draw(screen)
+        invaders.draw(screen)
+        if logo:
+            screen.blit(logo, (WIDTH - logo.get_width() - 16, 16))
+        base_y = 16 + (logo.get_height() + 8 if logo else 0)
+        screen.blit(render_text(small_font, f"Time: {120 - frame // 60}", WHITE), (16, base_y))
+        screen.blit(render_text(small_font, f"Score: {frame * 10}", WHITE), (16, base_y + 28))
+        screen.blit(render_text(small_font, "Level: 3", WHITE), (16, base_y + 56))
+    return draw
+
+
+def make_intro_scene(screen, assets, fonts):
+    """Logo, title, hints and the intro leaderboard."""
+    font, small_font, _ = fonts
+    logo = assets["logo"]
+
+    def draw(frame):
+        screen.fill(BLACK)
+        y_offset = 40
+        if logo:
+            lr = logo.get_rect(midtop=(WIDTH // 2, y_offset))
+            screen.blit(logo, lr)
+            y_offset = lr.bottom + 20
+        title = render_text(font, "Conference Invaders", WHITE)
+        screen.blit(title, (WIDTH // 2 - title.get_width() // 2, y_offset))
+        hint = render_text(small_font, "Press Space to Start", WHITE)
+        screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, y_offset + 60))
+        draw_leaderboard(screen, fonts, LEADERBOARD, 8, WIDTH // 2, int(HEIGHT * 0.62))
+    return draw
+
+
+def make_menu_scene(screen, assets, fonts):
+    """Name input box (rounded rects, caret) and settings-style info box."""
+    font, small_font, mono_font = fonts
+    logo = assets["logo"]
+
+    def draw(frame):
+        screen.fill(BLACK)
+        if logo:
+            screen.blit(logo, (WIDTH - logo.get_width() - 16, 16))
+        title = render_text(font, "Enter your Name", WHITE)
+        screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 20))
+        typed = render_text(mono_font, "Ada Lovelace", WHITE)
+        box_rect = pygame.Rect(WIDTH // 2 - 190, HEIGHT // 2 + 30, 380, 44)
+        screen.draw_rect((60, 60, 60), box_rect, border_radius=6)
+        screen.draw_rect((140, 140, 140), box_rect, 2, border_radius=6)
+        screen.blit(typed, (box_rect.x + 12, box_rect.y + 9))
+        if frame % 60 < 36:
+            screen.draw_rect(WHITE, (box_rect.x + 14 + typed.get_width(), box_rect.y + 9, 2, 26))
+        screen.draw_rect((40, 40, 40), (WIDTH // 2 - 220, HEIGHT - 100, 440, 40), border_radius=8)
+        msg = render_text(small_font, "Exported to leaderboard.csv", WHITE)
+        screen.blit(msg, (WIDTH // 2 - msg.get_width() // 2, HEIGHT - 92))
+        screen.draw_rect(BLACK, (0, HEIGHT - 60, WIDTH, 10))
+    return draw
+
+
+SCENES = [
+    ("gameplay", make_gameplay_scene),
+    ("intro", make_intro_scene),
+    ("menus", make_menu_scene),
+]
+
+
+def run_backend(name, frames):
+    pygame.display.init()
+    render_text.cache_clear()
+    fonts = (
+        pygame.font.SysFont("Arial", 28),
+        pygame.font.SysFont("Arial", 22),
+        pygame.font.SysFont("Consolas", 22),
+    )
+    screen = render.BACKENDS[name]((WIDTH, HEIGHT), False, f"Benchmark: {name}")
+    assets = load_assets(screen)
+    results = {}
+    for scene_name, make_scene in SCENES:
+        draw = make_scene(screen, assets, fonts)
+        draw(0); screen.flip()  # warm up caches / texture uploads
+        start = time.perf_counter()
+        for frame in range(1, frames + 1):
+            pygame.event.pump()
+            draw(frame)
+            screen.flip()
+        elapsed = time.perf_counter() - start
+        pixels = pygame.Surface((WIDTH, HEIGHT), 0, 32)
+        pixels.blit(screen.read_pixels(), (0, 0))
+        results[scene_name] = (elapsed, pixels)
+    pygame.display.quit()
+    return results
+
+
+def count_mismatches(a, b, tolerance=PIXEL_TOLERANCE):
+    diff = a.copy()
+    diff.blit(b, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    other = b.copy()
+    other.blit(a, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+    diff.blit(other, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    same = pygame.mask.from_threshold(diff, BLACK, (tolerance + 1,) * 3 + (255,))
+    return WIDTH * HEIGHT - same.count()
+
+
+def main():
+    frames = FRAMES
+    if "--frames" in sys.argv:
+        frames = int(sys.argv[sys.argv.index("--frames") + 1])
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    pygame.init()
+    surface = run_backend("surface", frames)
+    renderer = run_backend("renderer", frames)
+    print(f"{frames} frames per scene at {WIDTH}x{HEIGHT}")
+    print(f"{'scene':<10} {'surface ms':>11} {'renderer ms':>12} {'speedup':>8} {'diff px':>8}")
+    for scene_name, _ in SCENES:
+        s_time, s_pixels = surface[scene_name]
+        r_time, r_pixels = renderer[scene_name]
+        print(
+            f"{scene_name:<10} {s_time / frames * 1000:>11.3f} {r_time / frames * 1000:>12.3f}"
+            f" {s_time / max(r_time, 1e-9):>7.2f}x {count_mismatches(s_pixels, r_pixels):>8}"
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ import random
 import json
 from datetime import datetime
 import controller
+import render
+from render import render_text
 
 # --- CONFIG ---
 WIDTH, HEIGHT = 1280, 800
@@ -16,6 +18,7 @@ PLAYER_IMAGE_PATH = "player.png"   # Custom player image (optional)
 ENEMY_IMAGES_DIR = "enemies"       # Directory containing up to 5 custom enemy PNGs
 ENEMY_SIZE = (64, 48)
 START_FULLSCREEN = False
+RENDER_BACKEND = "surface"        # "surface" (software blits) or "renderer" (SDL2 textures)
 LEADERBOARD_FILE = "leaderboard.json"
 LEADERBOARD_MAX_ENTRIES = 50
 INTRO_TOP_N = 8
@@ -45,27 +48,27 @@ mono_font = pygame.font.SysFont("Consolas", 22)
 controller.init()
 
 # --- Helpers ---
-flags = 0
-
 # Keep raw/original images so we can re-scale on fullscreen toggle
 logo_raw = None
 intro_image_raw = None
 
+screen = None
+
 def create_screen(fullscreen=False):
-    global WIDTH, HEIGHT, flags
-    # Use SCALED + DOUBLEBUF for smoother mode switches and initial paint
+    global WIDTH, HEIGHT
     if fullscreen:
-        flags = pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF
         info = pygame.display.Info()
         WIDTH, HEIGHT = info.current_w, info.current_h
-        screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+    # Surface backend uses SCALED + DOUBLEBUF for smoother mode switches and initial paint;
+    # the renderer backend keeps its window/renderer so uploaded textures stay valid
+    if screen is None:
+        new_screen = render.BACKENDS[render_backend]((WIDTH, HEIGHT), fullscreen, "Conference Invaders")
     else:
-        flags = pygame.SCALED | pygame.DOUBLEBUF
-        screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
-    pygame.display.set_caption("Conference Invaders")
+        new_screen = screen
+        new_screen.set_mode((WIDTH, HEIGHT), fullscreen)
     # Immediate flip helps avoid a first-frame black screen on some platforms
-    pygame.display.flip()
-    return screen
+    new_screen.flip()
+    return new_screen
 
 
 def rescale_assets():
@@ -95,6 +98,11 @@ def rescale_assets():
 is_fullscreen = START_FULLSCREEN or ("--fullscreen" in sys.argv)
 if "--windowed" in sys.argv:
     is_fullscreen = False
+render_backend = RENDER_BACKEND
+if "--renderer" in sys.argv:
+    render_backend = "renderer"
+if "--surface" in sys.argv:
+    render_backend = "surface"
 
 screen = create_screen(is_fullscreen)
 clock = pygame.time.Clock()
@@ -102,25 +110,25 @@ clock = pygame.time.Clock()
 # --- Load Images ---
 logo = None
 if os.path.exists(LOGO_IMAGE_PATH):
-    logo_raw = pygame.image.load(LOGO_IMAGE_PATH).convert_alpha()
+    logo_raw = screen.convert(pygame.image.load(LOGO_IMAGE_PATH))
 
 intro_image = None
 if os.path.exists(INTRO_IMAGE_PATH):
-    intro_image_raw = pygame.image.load(INTRO_IMAGE_PATH).convert_alpha()
+    intro_image_raw = screen.convert(pygame.image.load(INTRO_IMAGE_PATH))
 
 # Initial scale to current display size
 rescale_assets()
 
 player_image = None
 if os.path.exists(PLAYER_IMAGE_PATH):
-    player_image = pygame.image.load(PLAYER_IMAGE_PATH).convert_alpha()
+    player_image = screen.convert(pygame.image.load(PLAYER_IMAGE_PATH))
     player_image = pygame.transform.smoothscale(player_image, (80, 60))
 
 enemy_images = []
 if os.path.exists(ENEMY_IMAGES_DIR):
     for file in os.listdir(ENEMY_IMAGES_DIR):
         if file.lower().endswith(".png"):
-            img = pygame.image.load(os.path.join(ENEMY_IMAGES_DIR, file)).convert_alpha()
+            img = screen.convert(pygame.image.load(os.path.join(ENEMY_IMAGES_DIR, file)))
             img = pygame.transform.smoothscale(img, ENEMY_SIZE)
             enemy_images.append(img)
         if len(enemy_images) >= 5:
@@ -212,11 +220,17 @@ class Player(pygame.sprite.Sprite):
         except:
             pass
 
+# Bullets of the same color/size share one image (and one texture on the renderer backend)
+bullet_images = {}
+
 class Bullet(pygame.sprite.Sprite):
     def __init__(self, x, y, color=WHITE, speed=-10, size=(6, 20)):
         super().__init__()
-        self.image = pygame.Surface(size)
-        self.image.fill(color)
+        if (color, size) not in bullet_images:
+            image = pygame.Surface(size)
+            image.fill(color)
+            bullet_images[(color, size)] = image
+        self.image = bullet_images[(color, size)]
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = speed
     def update(self):
@@ -262,17 +276,17 @@ start_ticks = None
 def draw_leaderboard(surface, entries, title="Top Scores", top_n=10, x=None, y=None):
     if x is None: x = WIDTH // 2
     if y is None: y = int(HEIGHT * 0.62)
-    header = font.render(title, True, WHITE)
+    header = render_text(font, title, WHITE)
     surface.blit(header, (x - header.get_width() // 2, y))
     y += header.get_height() + 6
     shown = entries[:top_n]
     if not shown:
-        msg = small_font.render("No scores yet. Be the first!", True, GRAY)
+        msg = render_text(small_font, "No scores yet. Be the first!", GRAY)
         surface.blit(msg, (x - msg.get_width() // 2, y))
         return
 
     # column headers
-    hdr = mono_font.render(f"   NAME              COMPANY            SCORE  LVL", True, GRAY)
+    hdr = render_text(mono_font, f"   NAME              COMPANY            SCORE  LVL", GRAY)
     surface.blit(hdr, (x - 320, y))
     y += hdr.get_height() + 2
 
@@ -280,7 +294,7 @@ def draw_leaderboard(surface, entries, title="Top Scores", top_n=10, x=None, y=N
         name = e.get('name') or '—'
         company = e.get('company') or '—'
         line = f"{idx:>2}. {name:<16}  {company:<18}  {e['score']:>5}  L{e['level']:<2}"
-        txt = mono_font.render(line, True, WHITE)
+        txt = render_text(mono_font, line, WHITE)
         surface.blit(txt, (x - 320, y))
         y += txt.get_height() + 2
 
@@ -289,7 +303,7 @@ def draw_leaderboard(surface, entries, title="Top Scores", top_n=10, x=None, y=N
 def confirm_clear_leaderboard():
     """Ask the admin to type CONFIRM to clear the leaderboard."""
     global leaderboard
-    msg = small_font.render("Type 'CONFIRM' then Enter to clear, or Esc to cancel", True, WHITE)
+    msg = render_text(small_font, "Type 'CONFIRM' then Enter to clear, or Esc to cancel", WHITE)
     typed = ""
     while True:
         for event in pygame.event.get():
@@ -303,9 +317,9 @@ def confirm_clear_leaderboard():
                         leaderboard = []
                         save_leaderboard(leaderboard)
                         screen.fill(BLACK)
-                        ok = small_font.render("Leaderboard cleared.", True, WHITE)
+                        ok = render_text(small_font, "Leaderboard cleared.", WHITE)
                         screen.blit(ok, (WIDTH//2 - ok.get_width()//2, HEIGHT//2))
-                        pygame.display.flip()
+                        screen.flip()
                         pygame.time.wait(1000)
                         return True
                 elif event.key == pygame.K_BACKSPACE:
@@ -313,13 +327,13 @@ def confirm_clear_leaderboard():
                 elif event.unicode and event.unicode.isprintable():
                     typed += event.unicode
         screen.fill(BLACK)
-        title = font.render("Settings", True, WHITE)
+        title = render_text(font, "Settings", WHITE)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, HEIGHT//2 - 80))
         screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - 30))
-        box = mono_font.render(typed, True, WHITE)
-        pygame.draw.rect(screen, (60,60,60), (WIDTH//2-200, HEIGHT//2+10, 400, 40), border_radius=6)
+        box = render_text(mono_font, typed, WHITE)
+        screen.draw_rect((60,60,60), (WIDTH//2-200, HEIGHT//2+10, 400, 40), border_radius=6)
         screen.blit(box, (WIDTH//2 - 190, HEIGHT//2 + 16))
-        pygame.display.flip()
+        screen.flip()
         clock.tick(FPS)
 
 
@@ -345,21 +359,21 @@ def show_settings():
                 if event.key == pygame.K_F11:
                     toggle_fullscreen()
         screen.fill(BLACK)
-        title = font.render("Settings", True, WHITE)
+        title = render_text(font, "Settings", WHITE)
         screen.blit(title, (WIDTH//2 - title.get_width()//2, 120))
-        hint = small_font.render("Press 'C' to Clear Leaderboard (requires confirmation)", True, WHITE)
-        export_hint = small_font.render("Press 'E' to Export Leaderboard to CSV", True, WHITE)
-        back = small_font.render("Press Esc or I to go back", True, GRAY)
+        hint = render_text(small_font, "Press 'C' to Clear Leaderboard (requires confirmation)", WHITE)
+        export_hint = render_text(small_font, "Press 'E' to Export Leaderboard to CSV", WHITE)
+        back = render_text(small_font, "Press Esc or I to go back", GRAY)
         screen.blit(hint, (WIDTH//2 - hint.get_width()//2, 200))
         screen.blit(export_hint, (WIDTH//2 - export_hint.get_width()//2, 232))
         screen.blit(back, (WIDTH//2 - back.get_width()//2, 264))
         draw_leaderboard(screen, leaderboard, title="Top Scores (preview)", top_n=5, x=WIDTH//2, y=320)
         # transient info message
         if info_msg and pygame.time.get_ticks() < info_timer:
-            msg_surface = small_font.render(info_msg, True, WHITE)
-            pygame.draw.rect(screen, (40,40,40), (WIDTH//2-220, HEIGHT-100, 440, 40), border_radius=8)
+            msg_surface = render_text(small_font, info_msg, WHITE)
+            screen.draw_rect((40,40,40), (WIDTH//2-220, HEIGHT-100, 440, 40), border_radius=8)
             screen.blit(msg_surface, (WIDTH//2 - msg_surface.get_width()//2, HEIGHT - 92))
-        pygame.display.flip()
+        screen.flip()
         clock.tick(FPS)
 
 # --- Intro Screen ---
@@ -372,10 +386,10 @@ def draw_intro_frame():
         lr = logo.get_rect(midtop=(WIDTH // 2, y_offset))
         screen.blit(logo, lr)
         y_offset = lr.bottom + 20
-    title = font.render("Conference Invaders", True, WHITE)
+    title = render_text(font, "Conference Invaders", WHITE)
     screen.blit(title, (WIDTH // 2 - title.get_width() // 2, y_offset))
-    hint1 = small_font.render("Press Space to Start", True, WHITE)
-    hint2 = small_font.render("F11: Toggle Fullscreen | Esc: Quit", True, WHITE)
+    hint1 = render_text(small_font, "Press Space to Start", WHITE)
+    hint2 = render_text(small_font, "F11: Toggle Fullscreen | Esc: Quit", WHITE)
     if intro_image:
         ir = intro_image.get_rect(center=(WIDTH // 2, int(HEIGHT * 0.38)))
         screen.blit(intro_image, ir)
@@ -385,7 +399,7 @@ def draw_intro_frame():
     screen.blit(hint1, (WIDTH // 2 - hint1.get_width() // 2, y_after))
     screen.blit(hint2, (WIDTH // 2 - hint2.get_width() // 2, y_after + 40))
     draw_leaderboard(screen, leaderboard, title="Top Scores", top_n=INTRO_TOP_N)
-    pygame.display.flip()
+    screen.flip()
 
 
 def show_intro():
@@ -406,7 +420,7 @@ def show_intro():
                 if event.key == pygame.K_F11:
                     toggle_fullscreen()
                     draw_intro_frame()
-                    pygame.display.flip()
+                    screen.flip()
         clock.tick(60)
 
 # Fullscreen toggle
@@ -423,12 +437,12 @@ def toggle_fullscreen():
         pygame.time.wait(10)
     # One immediate clear to ensure no stale buffer
     screen.fill(BLACK)
-    pygame.display.flip()
+    screen.flip()
 
 # Level banner
 
 def show_level_banner(level:int):
-    banner = font.render(f"Level {level}", True, WHITE)
+    banner = render_text(font, f"Level {level}", WHITE)
     timer = 0
     while timer < 900:  # ~0.9 seconds
         for event in pygame.event.get():
@@ -440,7 +454,7 @@ def show_level_banner(level:int):
         if logo:
             screen.blit(logo, (WIDTH - logo.get_width() - 16, 16))
         screen.blit(banner, (WIDTH//2 - banner.get_width()//2, HEIGHT//2 - banner.get_height()//2))
-        pygame.display.flip()
+        screen.flip()
         clock.tick(FPS)
         timer += 1000 // FPS
 
@@ -469,20 +483,20 @@ def text_input_screen(title_text: str, placeholder: str = "", max_chars: int = 1
         screen.fill(BLACK)
         if logo:
             screen.blit(logo, (WIDTH - logo.get_width() - 16, 16))
-        title = font.render(title_text, True, WHITE)
+        title = render_text(font, title_text, WHITE)
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, HEIGHT // 2 - 20))
         # Input box
-        typed_surface = mono_font.render(typed or placeholder, True, WHITE if typed else GRAY)
+        typed_surface = render_text(mono_font, typed or placeholder, WHITE if typed else GRAY)
         box_w = max(380, typed_surface.get_width() + 24)
         box_rect = pygame.Rect(WIDTH // 2 - box_w // 2, HEIGHT // 2 + 30, box_w, 44)
-        pygame.draw.rect(screen, (60,60,60), box_rect, border_radius=6)
-        pygame.draw.rect(screen, (140,140,140), box_rect, 2, border_radius=6)
+        screen.draw_rect((60,60,60), box_rect, border_radius=6)
+        screen.draw_rect((140,140,140), box_rect, 2, border_radius=6)
         screen.blit(typed_surface, (box_rect.x + 12, box_rect.y + 9))
         if caret_visible and typed:
             cx = box_rect.x + 12 + typed_surface.get_width() + 2
             cy = box_rect.y + 9
-            pygame.draw.rect(screen, WHITE, (cx, cy, 2, 26))
-        pygame.display.flip()
+            screen.draw_rect(WHITE, (cx, cy, 2, 26))
+        screen.flip()
         clock.tick(FPS)
 
 # --- Main Game Session ---
@@ -567,9 +581,9 @@ def run_game():
             screen.blit(logo, (WIDTH - logo.get_width() - 16, 16))
 
         # HUD
-        timer_text = small_font.render(f"Time: {remaining}", True, WHITE)
-        score_text = small_font.render(f"Score: {score}", True, WHITE)
-        lvl_text = small_font.render(f"Level: {level}", True, WHITE)
+        timer_text = render_text(small_font, f"Time: {remaining}", WHITE)
+        score_text = render_text(small_font, f"Score: {score}", WHITE)
+        lvl_text = render_text(small_font, f"Level: {level}", WHITE)
         base_y = 16 + (logo.get_height() + 8 if logo else 0)
         screen.blit(timer_text, (16, base_y))
         screen.blit(score_text, (16, base_y + 28))
@@ -579,7 +593,7 @@ def run_game():
         if remaining <= 0:
             running = False
 
-        pygame.display.flip()
+        screen.flip()
 
     # Game Over -> Inputs -> Save -> Final leaderboard screen
     name = text_input_screen("Enter your Name", "Name", 16)
@@ -587,14 +601,14 @@ def run_game():
     add_score(name, company, score, level)
 
     screen.fill(BLACK)
-    over_text = font.render("Thanks for Playing!", True, WHITE)
-    details = small_font.render(
-        f"Saved: {name or '—'} | {company or '—'} | Score: {score} | Level: {level}", True, WHITE
+    over_text = render_text(font, "Thanks for Playing!", WHITE)
+    details = render_text(
+        small_font, f"Saved: {name or '—'} | {company or '—'} | Score: {score} | Level: {level}", WHITE
     )
     screen.blit(over_text, (WIDTH // 2 - over_text.get_width() // 2, HEIGHT // 2 - 120))
     screen.blit(details, (WIDTH // 2 - details.get_width() // 2, HEIGHT // 2 - 80))
     draw_leaderboard(screen, leaderboard, title="Leaderboard", top_n=12, x=WIDTH//2, y=HEIGHT//2 - 20)
-    pygame.display.flip()
+    screen.flip()
 
 # --- Post-Game Menu / Replay ---
 
@@ -609,14 +623,14 @@ def post_game_menu():
                 if event.type == pygame.QUIT:
                     return 'quit'
             remaining = max(0, (end_time - pygame.time.get_ticks()) // 1000)
-            overlay = small_font.render(f"Restarting in {remaining}s... (Press R to replay, ESC to quit)", True, WHITE)
+            overlay = render_text(small_font, f"Restarting in {remaining}s... (Press R to replay, ESC to quit)", WHITE)
             screen.blit(overlay, (WIDTH//2 - overlay.get_width()//2, HEIGHT - 60))
-            pygame.display.flip()
+            screen.flip()
             clock.tick(FPS)
         return 'intro'
 
-    prompt1 = small_font.render("Press R to Replay", True, WHITE)
-    prompt2 = small_font.render("Press I for Intro, ESC to Quit", True, WHITE)
+    prompt1 = render_text(small_font, "Press R to Replay", WHITE)
+    prompt2 = render_text(small_font, "Press I for Intro, ESC to Quit", WHITE)
     while True:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -628,10 +642,10 @@ def post_game_menu():
                     return 'intro'
                 if event.key == pygame.K_F11:
                     toggle_fullscreen()
-        pygame.draw.rect(screen, (0,0,0), (0, HEIGHT-90, WIDTH, 90))
+        screen.draw_rect((0,0,0), (0, HEIGHT-90, WIDTH, 90))
         screen.blit(prompt1, (WIDTH//2 - prompt1.get_width()//2, HEIGHT - 84))
         screen.blit(prompt2, (WIDTH//2 - prompt2.get_width()//2, HEIGHT - 52))
-        pygame.display.flip()
+        screen.flip()
         clock.tick(FPS)
 
 # --- Flow ---
@@ -0,0 +1,159 @@
+import functools
+import weakref
+import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+
+# Both screens expose the same small drawing API used by the game:
+# fill / blit / blits / draw_rect / flip, plus convert() for loaded images.
+# Sprite groups can draw straight onto either one (Group.draw uses blits).
+
+@functools.lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Cached font.render so repeated HUD/menu text keeps the same Surface (and texture)."""
+    return font.render(text, True, color)
+
+
+class SurfaceScreen:
+    """Software blits onto the display.set_mode surface (SCALED + DOUBLEBUF)."""
+    name = "surface"
+
+    def __init__(self, size, fullscreen=False, title=""):
+        self.set_mode(size, fullscreen)
+        pygame.display.set_caption(title)
+
+    def set_mode(self, size, fullscreen=False):
+        flags = pygame.SCALED | pygame.DOUBLEBUF
+        if fullscreen:
+            flags |= pygame.FULLSCREEN
+        self.surface = pygame.display.set_mode(size, flags)
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def convert(self, image):
+        return image.convert_alpha()
+
+    def fill(self, color, rect=None):
+        return self.surface.fill(color, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        return self.surface.blit(source, dest, area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        return self.surface.blits(blit_sequence, doreturn)
+
+    def draw_rect(self, color, rect, width=0, border_radius=0):
+        return pygame.draw.rect(self.surface, color, rect, width, border_radius=border_radius)
+
+    def flip(self):
+        pygame.display.flip()
+
+    def read_pixels(self):
+        return self.surface.copy()
+
+
+@functools.lru_cache(maxsize=64)
+def _rect_surface(color, size, width, border_radius):
+    # Outlined / rounded rects have no Renderer primitive; draw them once with
+    # pygame.draw so they match the Surface path pixel for pixel.
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surf, color, surf.get_rect(), width, border_radius=border_radius)
+    return surf
+
+
+class TextureScreen:
+    """SDL2 Window/Renderer backend: surfaces are uploaded once as textures
+    and each frame is composed with texture copies.
+
+    Frames are drawn into a persistent target texture so that partial redraws
+    (e.g. the post-game prompt painted over the last frame) behave like the
+    display surface. Works with SDL's software renderer when no GPU is
+    available; set SDL_RENDER_DRIVER=software to force it.
+    """
+    name = "renderer"
+
+    def __init__(self, size, fullscreen=False, title=""):
+        self.window = Window(title, size=size)
+        self.renderer = Renderer(self.window, accelerated=-1, target_texture=True)
+        self._textures = weakref.WeakKeyDictionary()
+        self._target = None
+        self.set_mode(size, fullscreen)
+
+    def set_mode(self, size, fullscreen=False):
+        if fullscreen:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.set_windowed()
+            self.window.size = size
+        # Logical size belongs to the window view, so set it with no target bound.
+        self.renderer.target = None
+        self.renderer.logical_size = size
+        if self._target is None or self._target.get_rect().size != tuple(size):
+            self._target = Texture(self.renderer, size, target=True)
+        self.renderer.target = self._target
+
+    def get_size(self):
+        return self._target.get_rect().size
+
+    def convert(self, image):
+        # convert_alpha() needs a display mode; textures accept any format,
+        # only smoothscale needs 24/32-bit pixels.
+        if image.get_bitsize() < 24:
+            image = image.convert(32)
+        return image
+
+    def texture(self, surface):
+        tex = self._textures.get(surface)
+        if tex is None:
+            tex = Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = tex
+        return tex
+
+    def fill(self, color, rect=None):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+            return pygame.Rect((0, 0), self.get_size())
+        rect = pygame.Rect(rect)
+        self.renderer.fill_rect(rect)
+        return rect
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if not source.get_width() or not source.get_height():
+            # e.g. rendering an empty string; SDL can't make a 0-sized texture
+            return pygame.Rect(dest[0], dest[1], 0, 0)
+        tex = self.texture(source)
+        if area is not None:
+            area = pygame.Rect(area).clip(tex.get_rect())
+            dstrect = pygame.Rect(dest[0], dest[1], area.w, area.h)
+        else:
+            dstrect = pygame.Rect((dest[0], dest[1]), tex.get_rect().size)
+        tex.draw(srcrect=area, dstrect=dstrect)
+        return dstrect.clip(pygame.Rect((0, 0), self.get_size()))
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*args) for args in blit_sequence]
+        return rects if doreturn else None
+
+    def draw_rect(self, color, rect, width=0, border_radius=0):
+        rect = pygame.Rect(rect)
+        if width == 0 and border_radius == 0:
+            return self.fill(color, rect)
+        return self.blit(_rect_surface(tuple(color), rect.size, width, border_radius), rect.topleft)
+
+    def flip(self):
+        self.renderer.target = None
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self._target.draw()
+        self.renderer.present()
+        self.renderer.target = self._target
+
+    def read_pixels(self):
+        return self.renderer.to_surface()
+
+
+BACKENDS = {
+    SurfaceScreen.name: SurfaceScreen,
+    TextureScreen.name: TextureScreen,
+}